@@ -197,25 +197,28 @@ static int parse_binary_string(const char* input, truth_table_t* tt) {
  * @brief Parse minterm list format
  */
 static int parse_minterm_list(const char* input, truth_table_t* tt) {
-    char* input_copy = strdup(input);
-    if (!input_copy) return -1;
-    
     tt->minterms = 0;
     tt->dont_cares = 0;
     tt->minterm_count = 0;
     
     uint8_t max_minterm = 0;
-    char* token = strtok(input_copy, ",");
-    
-    while (token) {
+    const char* p = input;
+    
+    /* Walk tokens in place (reentrant, unlike strtok) */
+    while (*p) {
+        /* Empty tokens are skipped */
+        if (*p == ',') {
+            p++;
+            continue;
+        }
+        
         /* Skip whitespace */
-        while (isspace(*token)) token++;
+        while (isspace((unsigned char)*p)) p++;
         
         char* endptr;
-        long value = strtol(token, &endptr, 10);
+        long value = strtol(p, &endptr, 10);
         
-        if (*endptr != '\0' || value < 0 || value >= MAX_CELLS) {
-            free(input_copy);
+        if ((*endptr != ',' && *endptr != '\0') || value < 0 || value >= MAX_CELLS) {
             return -1;
         }
         
@@ -225,11 +228,9 @@ static int parse_minterm_list(const char* input, truth_table_t* tt) {
         tt->minterms |= (1ULL << minterm);
         tt->minterm_count++;
         
-        token = strtok(NULL, ",");
+        p = endptr;
     }
     
-    free(input_copy);
-    
     /* Determine number of variables from highest minterm */
     tt->num_vars = 2;
     while ((1U << tt->num_vars) <= max_minterm) tt->num_vars++;
@@ -281,6 +282,17 @@ int solve_kmap(const char* input, char* output, int output_len) {
     return 0;
 }
 
+int solve_kmap_batch(const char** inputs, int n, char* outputs, int stride) {
+    if (!inputs || !outputs || n < 0 || stride <= 0) return -1;
+    
+    for (int i = 0; i < n; i++) {
+        int result = solve_kmap(inputs[i], outputs + (size_t)i * stride, stride);
+        if (result != 0) return result;
+    }
+    
+    return 0;
+}
+
 /* === DEBUG FUNCTIONS === */
 #ifdef DEBUG
 void debug_print_truth_table(const truth_table_t* tt) {
@@ -73,6 +73,16 @@ typedef struct {
  */
 int solve_kmap(const char* input, char* output, int output_len);
 
+/**
+ * @brief Solve several inputs in one call (amortizes FFI overhead)
+ * @param inputs Array of n input strings
+ * @param n Number of inputs
+ * @param outputs Buffer of n * stride bytes, result i at outputs + i * stride
+ * @param stride Size of each output slot
+ * @return 0 on success, error code of the first failing input otherwise
+ */
+int solve_kmap_batch(const char** inputs, int n, char* outputs, int stride);
+
 /**
  * @brief Parse input string into truth table structure
  * @param input Input string
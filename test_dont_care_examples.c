@@ -152,6 +152,32 @@ void test_example_4() {
     }
 }
 
+void test_example_5() {
+    printf("\n=== Test Example 5: Batch Solve ===\n");
+    printf("Input: {\"1010\", \"1100\"} then {\"1010\", \"zz\", \"1100\"}\n");
+    printf("Expected: Results at stride offsets, first error code returned\n");
+    
+    const int stride = 64;
+    char outputs[3 * 64];
+    
+    const char* good[] = {"1010", "1100"};
+    memset(outputs, 'Z', sizeof(outputs));
+    int result = solve_kmap_batch(good, 2, outputs, stride);
+    
+    printf("Batch result: %d\n", result);
+    printf("Slot 0: %s, Slot 1: %s\n", outputs, outputs + stride);
+    bool valid = (result == 0) &&
+                 strcmp(outputs, "A") == 0 &&
+                 strcmp(outputs + stride, "B") == 0;
+    printf("Stride layout correct: %s\n", valid ? "YES" : "NO");
+    
+    const char* bad[] = {"1010", "zz", "1100"};
+    result = solve_kmap_batch(bad, 3, outputs, stride);
+    
+    printf("Batch result with invalid input: %d\n", result);
+    printf("First error code returned: %s\n", result == -1 ? "YES" : "NO");
+}
+
 int main() {
     printf("Testing Don't Care Logic Implementation\n");
     printf("=======================================\n");
@@ -160,6 +186,7 @@ int main() {
     test_example_2(); 
     test_example_3();
     test_example_4();
+    test_example_5();
     
     printf("\n=== Don't Care Logic Test Complete ===\n");
     return 0;